@@ -3,9 +3,9 @@
 
 from typing import List, Optional, Union
 from dataclasses import dataclass, fields
-from pydantic import SecretStr
+from functools import lru_cache
 import enum
-import re
+import string
 import os
 
 
@@ -16,11 +16,33 @@ class LogLevel(enum.Enum):
     ERROR = "ERROR"
 
 
+LOG_LEVELS = {level.name: level for level in LogLevel}
+
+
+class Secret(str):
+    """A str that hides its value in repr(), str() and format(), like SecretStr."""
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "Secret('**********')"
+
+    def __str__(self) -> str:
+        return "**********"
+
+    def __format__(self, format_spec: str) -> str:
+        return format("**********", format_spec)
+
+    def get_secret_value(self) -> str:
+        return str.__str__(self)
+
+
 MIN_PORT = 1
 MAX_PORT = 65535
+HOSTNAME_CHARS = frozenset(string.ascii_letters + string.digits + ".-")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ServerConfiguration:
     host: str = "localhost"
     port: int = 80
@@ -29,30 +51,40 @@ class ServerConfiguration:
     static_files_directory: Optional[str] = None
     allowed_hosts: Optional[List[str]] = None
     timeout: Optional[int] = 10
-    ssl_cert: Optional[Union[SecretStr, str]] = None
-    ssl_key: Optional[Union[SecretStr, str]] = None
+    ssl_cert: Optional[Union[Secret, str]] = None
+    ssl_key: Optional[Union[Secret, str]] = None
     ssl_enabled: Optional[bool] = False
 
 
+BUILDER_DEFAULTS = {field.name: field.default for field in fields(ServerConfiguration)}
+
+
+# Cached to avoid a stat() per build. A directory created or removed after
+# the first check is not noticed until _is_directory.cache_clear().
+@lru_cache(maxsize=128)
+def _is_directory(path: str) -> bool:
+    return os.path.isdir(path)
+
+
 class ServerConfigurationBuilder:
     def __init__(self):
         self._reset()
 
     def _reset(self):
-        for field in fields(ServerConfiguration):
-            setattr(self, field.name, field.default)
+        self.__dict__.update(BUILDER_DEFAULTS)
 
     def _validate_allowed_hosts(self, allowed_hosts: Optional[List[str]]):
         if allowed_hosts:
+            is_hostname = HOSTNAME_CHARS.issuperset
             for host in allowed_hosts:
-                if not re.match(r"^[a-zA-Z0-9.-]+$", host):
+                if not host or not is_hostname(host):
                     raise ValueError(
                         f"Allowed host must be a valid hostname, got: {host}"
                     )
 
     def _validate_static_files_directory(self, static_files_directory: Optional[str]):
         if static_files_directory:
-            if not os.path.exists(static_files_directory):
+            if not _is_directory(static_files_directory):
                 raise ValueError(
                     f"Static files directory must be a valid directory, got: {static_files_directory}"
                 )
@@ -79,7 +111,7 @@ class ServerConfigurationBuilder:
                 f"Port is required and must be an integer between {MIN_PORT} and {MAX_PORT}, got: {port}"
             )
 
-    def _validate_ssl(self, ssl_enabled: bool, ssl_cert: SecretStr, ssl_key: SecretStr):
+    def _validate_ssl(self, ssl_enabled: bool, ssl_cert: Secret, ssl_key: Secret):
         if ssl_enabled is True:
             if not ssl_cert or not ssl_key:
                 raise ValueError(
@@ -118,13 +150,16 @@ class ServerConfigurationBuilder:
     def set_logging_level(
         self, logging_level: Optional[Union[LogLevel, str]]
     ) -> "ServerConfigurationBuilder":
-        if isinstance(logging_level, str):
-            try:
-                logging_level = LogLevel[logging_level.upper()]
-            except KeyError:
+        # The exact-type check is the fast path for plain strings; str
+        # subclasses (e.g. StrEnum members) fall through to isinstance and
+        # are parsed and validated the same way.
+        if type(logging_level) is str or isinstance(logging_level, str):
+            level = LOG_LEVELS.get(logging_level.upper())
+            if level is None:
                 raise ValueError(
-                    f"Logging level must be one of {list(LogLevel.__members__.keys())}, got {logging_level}."
+                    f"Logging level must be one of {list(LOG_LEVELS)}, got {logging_level}."
                 )
+            logging_level = level
         self.logging_level = logging_level
         return self
 
@@ -133,23 +168,27 @@ class ServerConfigurationBuilder:
         return self
 
     def set_ssl_cert(
-        self, ssl_cert: Optional[Union[SecretStr, str]]
+        self, ssl_cert: Optional[Union[Secret, str]]
     ) -> "ServerConfigurationBuilder":
-        self.ssl_cert = (
-            ssl_cert
-            if isinstance(ssl_cert, SecretStr)
-            else SecretStr(ssl_cert) if ssl_cert is not None else None
-        )
+        if ssl_cert is None or type(ssl_cert) is Secret:
+            self.ssl_cert = ssl_cert
+        else:
+            self.ssl_cert = Secret(
+                ssl_cert.get_secret_value()
+                if isinstance(ssl_cert, Secret)
+                else ssl_cert
+            )
         return self
 
     def set_ssl_key(
-        self, ssl_key: Optional[Union[SecretStr, str]]
+        self, ssl_key: Optional[Union[Secret, str]]
     ) -> "ServerConfigurationBuilder":
-        self.ssl_key = (
-            ssl_key
-            if isinstance(ssl_key, SecretStr)
-            else SecretStr(ssl_key) if ssl_key is not None else None
-        )
+        if ssl_key is None or type(ssl_key) is Secret:
+            self.ssl_key = ssl_key
+        else:
+            self.ssl_key = Secret(
+                ssl_key.get_secret_value() if isinstance(ssl_key, Secret) else ssl_key
+            )
         return self
 
     def set_allowed_hosts(
@@ -167,17 +206,18 @@ class ServerConfigurationBuilder:
         self._validate_allowed_hosts(self.allowed_hosts)
         self._validate_ssl(self.ssl_enabled, self.ssl_cert, self.ssl_key)
 
+        # Positional, in ServerConfiguration field order.
         config = ServerConfiguration(
-            host=self.host,
-            port=self.port,
-            max_connections=self.max_connections,
-            logging_level=self.logging_level,
-            static_files_directory=self.static_files_directory,
-            allowed_hosts=self.allowed_hosts,
-            timeout=self.timeout,
-            ssl_cert=self.ssl_cert,
-            ssl_key=self.ssl_key,
-            ssl_enabled=self.ssl_enabled,
+            self.host,
+            self.port,
+            self.max_connections,
+            self.logging_level,
+            self.static_files_directory,
+            self.allowed_hosts,
+            self.timeout,
+            self.ssl_cert,
+            self.ssl_key,
+            self.ssl_enabled,
         )
         self._reset()
         return config
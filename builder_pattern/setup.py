@@ -0,0 +1,16 @@
+# Optional: compile main.py with Cython for faster builder validation.
+#
+#     python setup.py build_ext --inplace
+#
+# This puts a compiled `main` extension next to main.py. It takes
+# priority over main.py on import, and main.py itself is unchanged.
+# Without Cython, or with the extension deleted, the pure-Python module
+# is used as before.
+
+from Cython.Build import cythonize
+from setuptools import setup
+
+setup(
+    name="builder-pattern-ext",
+    ext_modules=cythonize(["main.py"], language_level=3),
+)
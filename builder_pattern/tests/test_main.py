@@ -0,0 +1,63 @@
+import enum
+import unittest
+from pathlib import Path
+
+from main import LogLevel, Secret, ServerConfigurationBuilder
+
+
+class SecretTest(unittest.TestCase):
+    def build(self, cert, key):
+        return (
+            ServerConfigurationBuilder()
+            .set_ssl_enabled(True)
+            .set_ssl_cert(cert)
+            .set_ssl_key(key)
+            .build()
+        )
+
+    def test_ssl_values_are_masked(self):
+        config = self.build("CERT", "KEY")
+
+        key = config.ssl_key
+        for text in (str(key), f"{key}", f"{key:>20}", "{:s}".format(key), "%s" % key):
+            self.assertNotIn("KEY", text)
+        self.assertNotIn("CERT", repr(config))
+        self.assertEqual(config.ssl_cert.get_secret_value(), "CERT")
+        self.assertEqual(config.ssl_key.get_secret_value(), "KEY")
+
+    def test_secret_subclass_keeps_its_value(self):
+        class MySecret(Secret):
+            pass
+
+        config = self.build(MySecret("CERT"), Secret("KEY"))
+
+        self.assertIs(type(config.ssl_cert), Secret)
+        self.assertEqual(config.ssl_cert.get_secret_value(), "CERT")
+        self.assertEqual(config.ssl_key.get_secret_value(), "KEY")
+
+    def test_path_values_are_accepted(self):
+        config = self.build(Path("/etc/ssl/cert.pem"), Path("/etc/ssl/key.pem"))
+
+        self.assertEqual(config.ssl_cert.get_secret_value(), "/etc/ssl/cert.pem")
+        self.assertEqual(config.ssl_key.get_secret_value(), "/etc/ssl/key.pem")
+
+
+class LoggingLevelTest(unittest.TestCase):
+    def test_level_names_are_parsed(self):
+        class Level(str, enum.Enum):
+            INFO = "info"
+
+        for value in ("info", "INFO", Level.INFO):
+            with self.subTest(value=value):
+                builder = ServerConfigurationBuilder().set_logging_level(value)
+                self.assertIs(builder.logging_level, LogLevel.INFO)
+
+    def test_unknown_level_names_are_rejected(self):
+        for value in ("bogus", enum.StrEnum("X", {"BOGUS": "bogus"}).BOGUS):
+            with self.subTest(value=value):
+                with self.assertRaises(ValueError):
+                    ServerConfigurationBuilder().set_logging_level(value)
+
+
+if __name__ == "__main__":
+    unittest.main()
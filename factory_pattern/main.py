@@ -1,11 +1,13 @@
 import json
-import xml.etree.ElementTree as ET
+from xml.sax.saxutils import escape
 from typing import Dict, Any, Union
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict
 from abc import ABC, abstractmethod
 
+JSON_ENCODER = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class Song:
     title: str
     artist: str
@@ -23,16 +25,27 @@ class SongFactory(ABC):
 
 class JSONSongFactory(SongFactory):
     def serialize(self, song: Song) -> str:
-        return json.dumps(song.__dict__)
+        return JSON_ENCODER.encode(asdict(song))
 
 
 class XMLSongFactory(SongFactory):
+    # Song has a fixed schema, so the document is a plain template.
+    # Only the string fields need escaping; the int fields are safe as is.
+    TEMPLATE = (
+        "<song><title>{title}</title><artist>{artist}</artist>"
+        "<duration>{duration}</duration><genre>{genre}</genre>"
+        "<release_year>{release_year}</release_year><id>{id}</id></song>"
+    )
+
     def serialize(self, song: Song) -> str:
-        song_element = ET.Element("song")
-        for key, value in song.__dict__.items():
-            child = ET.SubElement(song_element, key)
-            child.text = str(value)
-        return ET.tostring(song_element, encoding="unicode")
+        return self.TEMPLATE.format(
+            title=escape(song.title),
+            artist=escape(song.artist),
+            duration=song.duration,
+            genre=escape(song.genre),
+            release_year=song.release_year,
+            id=song.id,
+        )
 
 
 class SongManager:
@@ -43,13 +56,13 @@ class SongManager:
         }
 
     def serialize(self, song: Song, format_type: str) -> Union[str, None]:
-        factory = self.factories.get(format_type.lower())
-        if not factory:
-            raise ValueError(f"Factory for format {format_type} not found.")
-        return factory.serialize(song)
+        return self.get_factory(format_type).serialize(song)
 
     def get_factory(self, format_type: str) -> SongFactory:
-        factory = self.factories.get(format_type.lower())
+        # Try the name as given first: lowercase names skip the .lower() copy.
+        factory = self.factories.get(format_type) or self.factories.get(
+            format_type.lower()
+        )
         if not factory:
             raise ValueError(f"Factory for format {format_type} not found.")
         return factory
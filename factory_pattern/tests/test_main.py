@@ -0,0 +1,41 @@
+import unittest
+
+from main import JSONSongFactory, Song, SongManager, XMLSongFactory
+
+SONG = Song(
+    title="Imagine",
+    artist="John Lennon",
+    duration=183,
+    genre="Rock",
+    release_year=1971,
+    id=1,
+)
+
+
+class SongManagerTest(unittest.TestCase):
+    def test_format_name_is_case_insensitive(self):
+        manager = SongManager()
+
+        self.assertEqual(
+            manager.serialize(SONG, "JSON"), manager.serialize(SONG, "json")
+        )
+
+    def test_serialize_sees_factories_added_later(self):
+        manager = SongManager()
+        manager.factories["json"] = XMLSongFactory()
+        manager.factories["raw"] = JSONSongFactory()
+
+        self.assertEqual(
+            manager.serialize(SONG, "json"), XMLSongFactory().serialize(SONG)
+        )
+        self.assertEqual(
+            manager.serialize(SONG, "raw"), JSONSongFactory().serialize(SONG)
+        )
+
+    def test_unknown_format(self):
+        with self.assertRaises(ValueError):
+            SongManager().serialize(SONG, "yaml")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import List, Union
+from typing import Dict, Tuple, Union
 from dataclasses import dataclass
+from functools import cached_property
 
 SUITS = ["Hearts", "Diamonds", "Clubs", "Spades"]
 RANKS = [
@@ -28,6 +29,8 @@ class CardType:
 
 
 class Card(ABC):
+    __slots__ = ("name",)
+
     def __init__(self, name: str):
         self.name = name
 
@@ -37,14 +40,19 @@ class Card(ABC):
 
 
 class StandardCard(Card):
+    __slots__ = ("suit", "rank", "value")
+
     def __init__(self, suit: str, rank: str, value: int):
         super().__init__(suit + rank + str(value))
         self.suit = suit
         self.rank = rank
         self.value = value
 
-    def get_card(self):
-        return {"suit": self.suit, "rank": self.rank, "value": self.value}
+    def get_card(self) -> "StandardCard":
+        return self
+
+    def __str__(self) -> str:
+        return f"{self.rank} of {self.suit}"
 
 
 class CardFactory(ABC):
@@ -53,37 +61,49 @@ class CardFactory(ABC):
         pass
 
 
+# Flyweight: one StandardCard per (suit, rank, value) for the whole process.
+_STANDARD_CARDS: Dict[Tuple[str, str, int], StandardCard] = {}
+
+
 class StandardCardFactory(CardFactory):
     def create_card(self, suit: str, rank: str, value: int) -> StandardCard:
-        return StandardCard(suit, rank, value)
+        key = (suit, rank, value)
+        card = _STANDARD_CARDS.get(key)
+        if card is None:
+            card = _STANDARD_CARDS[key] = StandardCard(suit, rank, value)
+        return card
 
 
 class CardFactoryManager:
     def __init__(self):
+        # Register factories through register_factory(): it also resets the
+        # cached all_factories, which editing this dict directly does not.
         self.factories = {
             CardType.STANDARD: StandardCardFactory(),
             # Add other card type factories here
         }
 
     def create_card(self, card_type: CardType, *args, **kwargs) -> Card:
-        factory = self.factories.get(card_type)
-        if not factory:
-            raise ValueError(f"Factory for card type {card_type} not found.")
-        return factory.create_card(*args, **kwargs)
+        return self.get_factory(card_type).create_card(*args, **kwargs)
 
     def get_factory(self, card_type: CardType) -> CardFactory:
-        factory = self.factories.get(card_type)
-        if not factory:
-            raise ValueError(f"Factory for card type {card_type} not found.")
-        return factory
+        try:
+            return self.factories[card_type]
+        except KeyError:
+            raise ValueError(f"Factory for card type {card_type} not found.") from None
+
+    @cached_property
+    def all_factories(self) -> Tuple[CardFactory, ...]:
+        return tuple(self.factories.values())
 
-    def get_all_factories(self) -> List[CardFactory]:
-        return list(self.factories.values())
+    def get_all_factories(self) -> Tuple[CardFactory, ...]:
+        return self.all_factories
 
     def register_factory(self, card_type: CardType, factory: CardFactory):
         if not isinstance(factory, CardFactory):
             raise TypeError("Factory must be an instance of CardFactory")
         self.factories[card_type] = factory
+        self.__dict__.pop("all_factories", None)
         return self
 
 
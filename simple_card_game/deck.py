@@ -13,6 +13,17 @@ from card import (
     RANKS,
 )
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Without an explicit rng, WeakShuffle seeds a new numpy Generator from the
+# random module on each call, so it stays reproducible under random.seed().
+# That costs ~10us per call; on 52 cards the numpy path only beats the pure
+# Python loop from about 48 swaps (64 swaps: ~19us vs ~25us).
+NUMPY_MIN_SWAPS = 64
+
 
 class ShuffleStrategy(ABC):
     @abstractmethod
@@ -30,20 +41,25 @@ class RandomShuffle(ShuffleStrategy):
 class RiffleShuffle(ShuffleStrategy):
     def shuffle(self, cards: List[Card]) -> List[Card]:
         left, right = cards[: len(cards) // 2], cards[len(cards) // 2 :]
+        n_left, n_right = len(left), len(right)
+        li = ri = 0
         mixed: List[Card] = []
-        while left or right:
-            if left and (not right or random.random() < 0.5):
-                mixed.append(left.pop(0))
-            if right and (not left or random.random() < 0.5):
-                mixed.append(right.pop(0))
+        while li < n_left or ri < n_right:
+            if li < n_left and (ri >= n_right or random.random() < 0.5):
+                mixed.append(left[li])
+                li += 1
+            if ri < n_right and (li >= n_left or random.random() < 0.5):
+                mixed.append(right[ri])
+                ri += 1
         return mixed
 
 
 class FisherYatesShuffle(ShuffleStrategy):
     def shuffle(self, cards: List[Card]) -> List[Card]:
         result = cards.copy()
+        randrange = random.randrange
         for i in range(len(result) - 1, 0, -1):
-            j = random.randint(0, i)
+            j = randrange(i + 1)
             result[i], result[j] = result[j], result[i]
         return result
 
@@ -51,13 +67,24 @@ class FisherYatesShuffle(ShuffleStrategy):
 class WeakShuffle(ShuffleStrategy):
     """N случайных свапов — плохой, но быстрый пример."""
 
-    def __init__(self, swaps: int = 10) -> None:
+    def __init__(self, swaps: int = 10, rng=None) -> None:
         self.swaps = swaps
+        self.rng = rng  # numpy.random.Generator, used for any number of swaps
 
     def shuffle(self, cards: List[Card]) -> List[Card]:
         result = cards.copy()
-        for _ in range(self.swaps):
-            i, j = random.randrange(len(result)), random.randrange(len(result))
+        rng = self.rng
+        if rng is None:
+            if np is None or self.swaps < NUMPY_MIN_SWAPS:
+                n = len(result)
+                for _ in range(self.swaps):
+                    i, j = random.randrange(n), random.randrange(n)
+                    result[i], result[j] = result[j], result[i]
+                return result
+            rng = np.random.default_rng(random.getrandbits(64))
+        # Draw every swap index pair in a single numpy call.
+        pairs = rng.integers(0, len(result), size=(self.swaps, 2)).tolist()
+        for i, j in pairs:
             result[i], result[j] = result[j], result[i]
         return result
 
@@ -83,24 +110,33 @@ class Deck(ABC):
 class StandardDeck(Deck):
     def __init__(self, shuffle_strategy: ShuffleStrategy | None = None):
         self.deck = []
+        self._game_deck: List[Card] | None = None
         self.shuffle_strategy = shuffle_strategy or RandomShuffle()
         self.factory = CardFactoryManager().get_factory(CardType.STANDARD)
 
     def create_deck(self, suits: List[str], ranks: List[str]):
-        for suit in suits:
-            for value, rank in enumerate(ranks):
-                card = self.factory.create_card(suit, rank, value + 1)
-                self.deck.append(card)
+        create_card = self.factory.create_card
+        self.deck.extend(
+            [
+                create_card(suit, rank, value + 1)
+                for suit in suits
+                for value, rank in enumerate(ranks)
+            ]
+        )
+        self._game_deck = None
         return self
 
     def shuffle_deck(self) -> List[Union[str, int]]:
         return self.shuffle_strategy.shuffle(self.deck)
 
     def get_game_deck(self) -> List[Union[str, int]]:
-        return self.shuffle_deck()
+        # Shuffle once; later draws take cards from the same game deck.
+        if self._game_deck is None:
+            self._game_deck = self.shuffle_deck()
+        return self._game_deck
 
     def get_current_card(self) -> Union[str, int]:
         game_deck = self.get_game_deck()
         if not game_deck:
             raise ValueError("Deck is empty, please create a new deck.")
-        return game_deck.pop(0)  # Return and remove the top card from the dec
+        return game_deck.pop()  # Return and remove the top card from the deck
@@ -15,7 +15,8 @@ SCORE = 50
 shuffle_strategy = FisherYatesShuffle()  # or RiffleShuffle(), WeakShuffle()
 deck = StandardDeck(shuffle_strategy)
 game_deck = deck.create_deck(SUITS, RANKS).get_game_deck()
-while True:
+game_over = False
+while not game_over:
     if game_deck:
         currentCard = deck.get_current_card().get_card()
         print("The current card is: ", currentCard)
@@ -29,8 +30,8 @@ while True:
             continue
         nextCard = deck.get_current_card().get_card()
         print(f"The next card is {nextCard}. You have {SCORE} points.")
-        if (answer == "h" and nextCard["value"] > currentCard["value"]) or (
-            answer == "l" and nextCard["value"] < currentCard["value"]
+        if (answer == "h" and nextCard.value > currentCard.value) or (
+            answer == "l" and nextCard.value < currentCard.value
         ):
             SCORE += 20
             print("Correct! You gain 20 points.")
@@ -41,7 +42,9 @@ while True:
         print(f"Your current card is now {currentCard}. You have {SCORE} points.")
         if SCORE <= 0:
             print("You have no points left. Game over.")
+            game_over = True
             break
         if len(game_deck) < NCARDS:
             print("There are no more cards left in the deck. Game over.")
+            game_over = True
             break
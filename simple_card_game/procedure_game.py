@@ -1,4 +1,7 @@
 import random
+from collections import namedtuple
+
+Card = namedtuple("Card", "rank suit value")
 
 SUIT_TUPLE = ("Пики", "Черви", "Крести", "Буби")
 RANK_TUPLE = ("2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K", "A")
@@ -21,7 +24,7 @@ def createDeck():
     deckList = []
     for suit in SUIT_TUPLE:
         for value, rank in enumerate(RANK_TUPLE):
-            deckList.append({"rank": rank, "suit": suit, "value": value + 1})
+            deckList.append(Card(rank, suit, value + 1))
     return deckList
 
 
@@ -37,9 +40,9 @@ print()
 while True:
     deckGame = shuffleDeck(createDeck())
     currentCard = getCards(deckGame)
-    currentCardValue = currentCard["value"]
-    currentCardRank = currentCard["rank"]
-    currentCardSuit = currentCard["suit"]
+    currentCardValue = currentCard.value
+    currentCardRank = currentCard.rank
+    currentCardSuit = currentCard.suit
     print(
         f"Your current card is {currentCardRank} of {currentCardSuit}. You have {SCORE} points."
     )
@@ -57,9 +60,9 @@ while True:
             print("Invalid input. Please enter 'h' for higher or 'l' for lower.")
             continue
         nextCard = getCards(deckGame)
-        nextCardValue = nextCard["value"]
-        nextCardRank = nextCard["rank"]
-        nextCardSuit = nextCard["suit"]
+        nextCardValue = nextCard.value
+        nextCardRank = nextCard.rank
+        nextCardSuit = nextCard.suit
         print(
             f"The next card is {nextCardRank} of {nextCardSuit}. You have {SCORE} points."
         )
@@ -72,9 +75,9 @@ while True:
             SCORE -= 15
             print("Incorrect! You lose 15 points.")
         currentCard = nextCard
-        currentCardValue = currentCard["value"]
-        currentCardRank = currentCard["rank"]
-        currentCardSuit = currentCard["suit"]
+        currentCardValue = currentCard.value
+        currentCardRank = currentCard.rank
+        currentCardSuit = currentCard.suit
         print(
             f"Your current card is now {currentCardRank} of {currentCardSuit}. You have {SCORE} points."
         )
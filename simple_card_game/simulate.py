@@ -0,0 +1,54 @@
+# Monte Carlo simulation of Higher or Lower, compiled with numba.
+# Optional dependencies: numpy and numba (pip install numpy numba). They are
+# needed only by this module; the interactive games run without them.
+
+import numba
+import numpy as np
+
+NCARDS = 8
+SCORE = 50
+N_VALUES = 13  # 2..A
+DECK_SIZE = 4 * N_VALUES
+
+
+@numba.njit(cache=True)
+def simulate_many(n_games: int, seed: int) -> int:
+    """Играет n_games партий Higher or Lower и возвращает число выигранных.
+
+    Колода хранится как массив значений карт (1..13), игрок ставит на
+    "выше", если текущая карта в нижней половине, иначе на "ниже".
+    Партия выиграна, если после NCARDS ходов очков больше, чем на старте.
+    """
+    np.random.seed(seed)
+    deck = np.arange(DECK_SIZE, dtype=np.int8) % N_VALUES + 1
+    middle = (N_VALUES + 1) // 2
+    wins = 0
+    for _ in range(n_games):
+        d = deck.copy()
+        for i in range(DECK_SIZE - 1, 0, -1):
+            j = np.random.randint(0, i + 1)
+            d[i], d[j] = d[j], d[i]
+
+        score = SCORE
+        current = d[0]
+        for k in range(1, NCARDS + 1):
+            next_card = d[k]
+            higher = current <= middle
+            if (higher and next_card > current) or (
+                not higher and next_card < current
+            ):
+                score += 20
+            else:
+                score -= 15
+            current = next_card
+            if score <= 0:
+                break
+        if score > SCORE:
+            wins += 1
+    return wins
+
+
+if __name__ == "__main__":
+    n_games = 1_000_000
+    wins = simulate_many(n_games, 42)
+    print(f"Won {wins} of {n_games} games ({wins / n_games:.2%}).")
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The game modules import each other by bare name (`from card import ...`).
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,26 @@
+import unittest
+
+from card import CardFactoryManager, StandardCardFactory
+
+
+class CardFactoryManagerTest(unittest.TestCase):
+    def test_get_all_factories_is_cached_and_immutable(self):
+        manager = CardFactoryManager()
+
+        factories = manager.get_all_factories()
+
+        self.assertIsInstance(factories, tuple)
+        self.assertIs(manager.get_all_factories(), factories)
+
+    def test_register_factory_resets_the_cache(self):
+        manager = CardFactoryManager()
+        manager.get_all_factories()
+        factory = StandardCardFactory()
+
+        manager.register_factory("other", factory)
+
+        self.assertIn(factory, manager.get_all_factories())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,28 @@
+import unittest
+
+from deck import RANKS, SUITS, StandardDeck
+
+
+class StandardDeckTest(unittest.TestCase):
+    def test_draws_use_up_the_game_deck(self):
+        deck = StandardDeck().create_deck(SUITS, RANKS)
+        game_deck = deck.get_game_deck()
+
+        drawn = [deck.get_current_card() for _ in range(len(SUITS) * len(RANKS))]
+
+        self.assertEqual(len(set(map(id, drawn))), 52)
+        self.assertEqual(game_deck, [])
+        with self.assertRaises(ValueError):
+            deck.get_current_card()
+
+    def test_create_deck_resets_the_game_deck(self):
+        deck = StandardDeck().create_deck(SUITS, RANKS)
+        deck.get_current_card()
+
+        deck.create_deck(SUITS, RANKS)
+
+        self.assertEqual(len(deck.get_game_deck()), 104)
+
+
+if __name__ == "__main__":
+    unittest.main()
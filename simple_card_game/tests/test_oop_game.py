@@ -0,0 +1,31 @@
+import os
+import subprocess
+import sys
+import unittest
+
+GAME_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def play(answers: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, "oop_game.py"],
+        cwd=GAME_DIR,
+        input=answers,
+        capture_output=True,
+        text=True,
+        timeout=10,
+    )
+
+
+class OopGameTest(unittest.TestCase):
+    def test_game_ends_cleanly(self):
+        for answer in ("h", "l"):
+            with self.subTest(answer=answer):
+                result = play(f"{answer}\n" * 100)
+
+                self.assertEqual(result.returncode, 0, result.stderr)
+                self.assertEqual(result.stdout.count("Game over."), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
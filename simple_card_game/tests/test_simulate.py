@@ -0,0 +1,28 @@
+import unittest
+
+try:
+    import simulate
+except ImportError:  # numpy/numba are optional
+    simulate = None
+
+
+@unittest.skipIf(simulate is None, "numba is not installed")
+class SimulateManyTest(unittest.TestCase):
+    def test_compiled_matches_python(self):
+        for seed in (0, 1, 42):
+            with self.subTest(seed=seed):
+                self.assertEqual(
+                    simulate.simulate_many(200, seed),
+                    simulate.simulate_many.py_func(200, seed),
+                )
+
+    def test_wins_are_bounded(self):
+        n_games = 500
+        wins = simulate.simulate_many(n_games, 7)
+
+        self.assertGreaterEqual(wins, 0)
+        self.assertLessEqual(wins, n_games)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+import random
+import unittest
+
+import deck
+from deck import NUMPY_MIN_SWAPS, WeakShuffle
+
+CARDS = list(range(52))
+
+
+class WeakShuffleTest(unittest.TestCase):
+    def check_seeded(self, swaps):
+        random.seed(1234)
+        first = WeakShuffle(swaps).shuffle(CARDS)
+        random.seed(1234)
+        second = WeakShuffle(swaps).shuffle(CARDS)
+
+        self.assertEqual(first, second)
+        self.assertEqual(sorted(first), CARDS)
+
+    def test_python_path_follows_random_seed(self):
+        self.check_seeded(NUMPY_MIN_SWAPS - 1)
+
+    @unittest.skipIf(deck.np is None, "numpy is not installed")
+    def test_numpy_path_follows_random_seed(self):
+        self.check_seeded(NUMPY_MIN_SWAPS * 10)
+
+    @unittest.skipIf(deck.np is None, "numpy is not installed")
+    def test_given_rng_is_used_for_any_number_of_swaps(self):
+        for swaps in (10, NUMPY_MIN_SWAPS * 10):
+            with self.subTest(swaps=swaps):
+
+                def shuffle():
+                    random.seed()
+                    rng = deck.np.random.default_rng(7)
+                    return WeakShuffle(swaps, rng).shuffle(CARDS)
+
+                result = shuffle()
+
+                self.assertEqual(result, shuffle())
+                self.assertEqual(sorted(result), CARDS)
+                self.assertNotEqual(result, CARDS)
+
+
+if __name__ == "__main__":
+    unittest.main()